@@ -81,6 +81,15 @@ def get_hedera_merchant_account(discovery_data: dict) -> str | None:
   return None
 
 
+def hbar_to_tinybars(amount_hbar: float) -> int:
+  """Convert an HBAR amount to whole tinybars (1 HBAR = 100,000,000 tinybars).
+
+  Rounds rather than truncates: totals arrive as tinybars divided by 10^8,
+  which is often a hair below the exact value (0.29 * 10^8 is 28999999.99...).
+  """
+  return round(amount_hbar * 100_000_000)
+
+
 def create_hedera_payment(
   customer_account_id: str,
   customer_private_key: str,
@@ -125,8 +134,7 @@ def create_hedera_payment(
   client = Client(network)
   client.set_operator(customer_acct, private_key)
 
-  # Convert HBAR to tinybars (1 HBAR = 100,000,000 tinybars)
-  amount_tinybars = int(amount_hbar * 100_000_000)
+  amount_tinybars = hbar_to_tinybars(amount_hbar)
 
   logger.info(
     "Transfer: %.2f HBAR from %s to %s",
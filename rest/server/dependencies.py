@@ -17,12 +17,16 @@
 This module contains dependency injection logic for FastAPI endpoints,
 including:
 - Header validation (Idempotency-Key, Request-Signature).
-- Service instantiation (CheckoutService, FulfillmentService).
+- Service instantiation (CheckoutService, FulfillmentService,
+  HederaPaymentService).
 - Database session management (Products and Transactions DBs).
 - Request signature verification for webhooks.
 """
 
 from collections.abc import AsyncGenerator
+import functools
+import logging
+import threading
 from typing import Annotated
 
 import config
@@ -34,8 +38,15 @@ from fastapi import Request
 from pydantic import BaseModel
 from services.checkout_service import CheckoutService
 from services.fulfillment_service import FulfillmentService
+from services.hedera_service import HederaPaymentService
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = logging.getLogger(__name__)
+
+# Serializes the first get_hedera_service() calls: lru_cache alone lets
+# concurrent misses (warm-up and request threads) each build a service.
+_hedera_service_lock = threading.Lock()
+
 
 class CommonHeaders(BaseModel):
   """Common headers used in UCP requests."""
@@ -66,24 +77,33 @@ async def idempotency_header(
 
 
 async def verify_signature(
+  request: Request,
   request_signature: str = Header(..., alias="Request-Signature"),
-) -> None:
-  """Verify the request signature.
+) -> bytes:
+  """Read the request body and verify its signature.
+
+  The verified body is returned so endpoints can parse it without reading
+  it a second time.
 
   Note: This is a placeholder implementation that bypasses validation if the
   signature is "test". A real implementation would verify the HMAC-SHA256
   signature of the request body.
 
   Args:
+    request: The incoming request.
     request_signature: The signature header from the platform.
 
+  Returns:
+    The raw request body.
+
   """
+  body = await request.body()
   # In tests, we might want to bypass validation if signature is "test"
   if request_signature == "test":
-    return
+    return body
   # In sample implementation, we don't enforce signature validation
   # as we don't share secrets with clients.
-  return
+  return body
 
 
 async def verify_simulation_secret(
@@ -105,6 +125,28 @@ def get_fulfillment_service() -> FulfillmentService:
   return FulfillmentService()
 
 
+def get_hedera_service() -> HederaPaymentService | None:
+  """Dependency provider for the shared HederaPaymentService.
+
+  Building the service parses the merchant key and sets up the network
+  client, so it is done exactly once per process, even when the startup
+  warm-up and the first requests ask for it concurrently. Returns None if
+  Hedera payments are not configured.
+  """
+  with _hedera_service_lock:
+    return _build_hedera_service()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_hedera_service() -> HederaPaymentService | None:
+  """Build the HederaPaymentService; callers must hold the lock."""
+  try:
+    return HederaPaymentService()
+  except Exception as e:  # pylint: disable=broad-exception-caught
+    logger.info("Hedera payment service not initialized: %s", e)
+    return None
+
+
 async def get_products_db() -> AsyncGenerator[AsyncSession, None]:
   """Dependency provider for Products DB session."""
   async with db.manager.products_session_factory() as session:
@@ -124,6 +166,9 @@ def get_checkout_service(
   ],
   products_session: Annotated[AsyncSession, Depends(get_products_db)],
   transactions_session: Annotated[AsyncSession, Depends(get_transactions_db)],
+  hedera_service: Annotated[
+    HederaPaymentService | None, Depends(get_hedera_service)
+  ],
 ) -> CheckoutService:
   """Dependency provider for CheckoutService."""
   return CheckoutService(
@@ -131,4 +176,5 @@ def get_checkout_service(
     products_session,
     transactions_session,
     str(request.base_url),
+    hedera_service,
   )
@@ -0,0 +1,293 @@
+#   Copyright 2026 UCP Authors
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Tests for the Hedera payment validation."""
+
+import asyncio
+import base64
+import importlib.util
+import os
+from pathlib import Path
+import threading
+import time
+from unittest import mock
+
+from absl.testing import absltest
+from hiero_sdk_python import AccountId
+from hiero_sdk_python import CryptoGetAccountBalanceQuery
+from hiero_sdk_python import PrivateKey
+from hiero_sdk_python import ResponseCode
+from hiero_sdk_python import TransactionId
+from hiero_sdk_python import TransferTransaction
+from services import hedera_service
+
+_PAYER = AccountId(0, 0, 1001)
+_PAYER_KEY = PrivateKey.generate_ed25519()
+_MERCHANT = AccountId(0, 0, 2002)
+
+# The sample client that signs payments for this server, checked against it.
+_CLIENT_PATH = (
+  Path(__file__).resolve().parent.parent
+  / "client"
+  / "flower_shop"
+  / "simple_happy_path_client.py"
+)
+
+
+def _load_client():
+  """Import the sample client script as a module."""
+  spec = importlib.util.spec_from_file_location(
+    "simple_happy_path_client", _CLIENT_PATH
+  )
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  return module
+
+
+def _make_service(
+  merchant_account_id: AccountId,
+) -> hedera_service.HederaPaymentService:
+  """Build a service for validation only, without a network client."""
+  service = object.__new__(hedera_service.HederaPaymentService)
+  service.merchant_account_id = merchant_account_id
+  service._merchant_key = hedera_service._account_key(merchant_account_id)
+  return service
+
+
+def _make_solo_service() -> hedera_service.HederaPaymentService:
+  """Build a service with a network client for the solo network."""
+  # The solo network uses its built-in node list, so no mirror node lookup.
+  env = {
+    "HEDERA_NETWORK": "solo",
+    "HEDERA_MERCHANT_ACCOUNT_ID": str(_MERCHANT),
+    "HEDERA_MERCHANT_PRIVATE_KEY": PrivateKey.generate_ecdsa().to_string(),
+  }
+  with mock.patch.dict(os.environ, env):
+    return hedera_service.HederaPaymentService()
+
+
+def _make_transfer(account_id: AccountId, tinybars: int) -> TransferTransaction:
+  """Build a transfer of tinybars from the payer to account_id."""
+  return (
+    TransferTransaction()
+    .add_hbar_transfer(_PAYER, -tinybars)
+    .add_hbar_transfer(account_id, tinybars)
+  )
+
+
+def _sign_transfer(account_id: AccountId, tinybars: int) -> str:
+  """Freeze and sign a transfer offline, as a client would, in base64."""
+  transaction = _make_transfer(account_id, tinybars).set_transaction_id(
+    TransactionId.generate(_PAYER)
+  )
+  transaction.node_account_id = AccountId(0, 0, 3)
+  transaction.freeze().sign(_PAYER_KEY)
+  return base64.b64encode(transaction.to_bytes()).decode("ascii")
+
+
+class ValidateTransactionTest(absltest.TestCase):
+  """Tests for HederaPaymentService._validate_transaction."""
+
+  def test_exact_amount(self) -> None:
+    """Tests that paying exactly the expected amount is accepted."""
+    service = _make_service(_MERCHANT)
+    service._validate_transaction(_make_transfer(_MERCHANT, 100_000_000), 1.0)
+
+  def test_one_tinybar_short(self) -> None:
+    """Tests that paying one tinybar less than expected is rejected."""
+    service = _make_service(_MERCHANT)
+    with self.assertRaisesRegex(ValueError, "Insufficient amount"):
+      service._validate_transaction(_make_transfer(_MERCHANT, 99_999_999), 1.0)
+
+  def test_expected_amount_is_rounded(self) -> None:
+    """Tests that the expected amount is rounded, not truncated."""
+    # 0.29 * 100_000_000 is 28999999.999999996, which int() would truncate.
+    service = _make_service(_MERCHANT)
+    service._validate_transaction(_make_transfer(_MERCHANT, 29_000_000), 0.29)
+    with self.assertRaisesRegex(ValueError, "Insufficient amount"):
+      service._validate_transaction(_make_transfer(_MERCHANT, 28_999_999), 0.29)
+
+  def test_no_merchant_transfer(self) -> None:
+    """Tests that a transfer to another account is rejected."""
+    service = _make_service(_MERCHANT)
+    with self.assertRaisesRegex(ValueError, "No transfer to merchant"):
+      service._validate_transaction(
+        _make_transfer(AccountId(0, 0, 3003), 100_000_000), 1.0
+      )
+
+  def test_alias_accounts(self) -> None:
+    """Tests that alias accounts only match the merchant's own alias."""
+    merchant_alias = PrivateKey.generate_ed25519().public_key()
+    other_alias = PrivateKey.generate_ed25519().public_key()
+    merchant = AccountId(0, 0, 0, alias_key=merchant_alias)
+    service = _make_service(merchant)
+
+    # Alias accounts share shard.realm.num 0.0.0 and differ only by alias.
+    with self.assertRaisesRegex(ValueError, "No transfer to merchant"):
+      service._validate_transaction(
+        _make_transfer(AccountId(0, 0, 0, alias_key=other_alias), 100_000_000),
+        1.0,
+      )
+    service._validate_transaction(
+      _make_transfer(AccountId(0, 0, 0, alias_key=merchant_alias), 100_000_000),
+      1.0,
+    )
+
+
+class ProcessPreSignedPaymentTest(absltest.TestCase):
+  """Tests for HederaPaymentService.process_pre_signed_payment."""
+
+  def setUp(self) -> None:
+    """Build a service on the solo network with submission stubbed out."""
+    super().setUp()
+    self.service = _make_solo_service()
+    self.addCleanup(self.service.client.close)
+
+    patcher = mock.patch.object(TransferTransaction, "execute", autospec=True)
+    self.execute = patcher.start()
+    self.addCleanup(patcher.stop)
+    self.execute.return_value = mock.Mock(
+      status=ResponseCode.SUCCESS, transaction_id="0.0.1001@1.2"
+    )
+
+  def _pay(self, signed_transaction: str, expected_amount_hbar: float) -> dict:
+    """Run process_pre_signed_payment to completion."""
+    return asyncio.run(
+      self.service.process_pre_signed_payment(
+        signed_transaction, expected_amount_hbar, "checkout_1"
+      )
+    )
+
+  def test_submits_payment_to_merchant(self) -> None:
+    """Tests that a valid payment is submitted with the service's client."""
+    result = self._pay(_sign_transfer(_MERCHANT, 100_000_000), 1.0)
+
+    self.assertEqual(result["status"], "SUCCESS")
+    self.assertEqual(result["transaction_id"], "0.0.1001@1.2")
+    self.execute.assert_called_once_with(mock.ANY, self.service.client)
+
+  def test_rejects_payment_to_other_account(self) -> None:
+    """Tests that a transfer to another account is never submitted."""
+    with self.assertRaisesRegex(ValueError, "No transfer to merchant"):
+      self._pay(_sign_transfer(AccountId(0, 0, 3003), 100_000_000), 1.0)
+    self.execute.assert_not_called()
+
+  def test_rejects_underpayment(self) -> None:
+    """Tests that paying one tinybar less than the total is never submitted."""
+    with self.assertRaisesRegex(ValueError, "Insufficient amount"):
+      self._pay(_sign_transfer(_MERCHANT, 28_999_999), 0.29)
+    self.execute.assert_not_called()
+
+  def test_accepts_rounded_total(self) -> None:
+    """Tests that a total converted to HBAR is matched in exact tinybars."""
+    # checkout_service passes total_tinybars / 100_000_000, which is inexact.
+    self._pay(_sign_transfer(_MERCHANT, 29_000_000), 29_000_000 / 100_000_000)
+    self.execute.assert_called_once()
+
+  def test_limits_concurrent_submissions(self) -> None:
+    """Tests that at most _MAX_CONCURRENT_SUBMISSIONS run at once."""
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def execute(transaction, client):
+      del transaction, client  # Unused
+      nonlocal running, max_running
+      with lock:
+        running += 1
+        max_running = max(max_running, running)
+      time.sleep(0.05)
+      with lock:
+        running -= 1
+      return mock.Mock(status=ResponseCode.SUCCESS, transaction_id="0.0.1@1.2")
+
+    self.execute.side_effect = execute
+    signed_transaction = _sign_transfer(_MERCHANT, 100_000_000)
+
+    async def pay_all() -> None:
+      await asyncio.gather(
+        *(
+          self.service.process_pre_signed_payment(
+            signed_transaction, 1.0, f"checkout_{i}"
+          )
+          for i in range(5)
+        )
+      )
+
+    with mock.patch.object(hedera_service, "_MAX_CONCURRENT_SUBMISSIONS", 2):
+      self.service = _make_solo_service()
+    self.addCleanup(self.service.client.close)
+    asyncio.run(pay_all())
+
+    self.assertEqual(self.execute.call_count, 5)
+    self.assertEqual(max_running, 2)
+
+  def test_accepts_client_signed_totals(self) -> None:
+    """Tests that totals signed with the sample client's conversion pass."""
+    hbar_to_tinybars = _load_client().hbar_to_tinybars
+    # Both sides see total_tinybars / 100_000_000, as the client and
+    # checkout_service compute it. 57_000_000 is Gardenias with US express
+    # shipping and 10OFF, which truncation used to sign one tinybar short.
+    for total_tinybars in (29_000_000, 57_000_000):
+      amount_hbar = total_tinybars / 100_000_000
+      self._pay(
+        _sign_transfer(_MERCHANT, hbar_to_tinybars(amount_hbar)), amount_hbar
+      )
+    self.assertEqual(self.execute.call_count, 2)
+
+    # Sweep every 0.001 HBAR up to 10 HBAR through the validation alone.
+    service = _make_service(_MERCHANT)
+    for total_tinybars in range(0, 1_000_000_000, 100_000):
+      amount_hbar = total_tinybars / 100_000_000
+      service._validate_transaction(
+        _make_transfer(_MERCHANT, hbar_to_tinybars(amount_hbar)), amount_hbar
+      )
+
+
+class WarmUpTest(absltest.TestCase):
+  """Tests for HederaPaymentService.warm_up."""
+
+  def setUp(self) -> None:
+    """Build a service on the solo network with the balance query stubbed."""
+    super().setUp()
+    self.service = _make_solo_service()
+    self.addCleanup(self.service.client.close)
+
+    patcher = mock.patch.object(
+      CryptoGetAccountBalanceQuery, "execute", autospec=True
+    )
+    self.execute = patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def test_queries_merchant_balance(self) -> None:
+    """Tests that the warm-up queries the merchant account on the client."""
+    with self.assertLogs(hedera_service.logger, "INFO") as logs:
+      asyncio.run(self.service.warm_up())
+
+    self.execute.assert_called_once_with(mock.ANY, self.service.client)
+    query = self.execute.call_args.args[0]
+    self.assertEqual(query.account_id, _MERCHANT)
+    self.assertIn("established", logs.output[-1])
+
+  def test_failure_is_logged(self) -> None:
+    """Tests that a failing query is logged instead of raised."""
+    self.execute.side_effect = RuntimeError("node unreachable")
+
+    with self.assertLogs(hedera_service.logger, "WARNING") as logs:
+      asyncio.run(self.service.warm_up())
+    self.assertIn("node unreachable", logs.output[0])
+
+
+if __name__ == "__main__":
+  absltest.main()
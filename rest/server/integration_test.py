@@ -15,10 +15,14 @@
 """Integration tests for the UCP SDK Server."""
 
 import asyncio
+import json
 from pathlib import Path
+import re
 import shutil
 import tempfile
+import threading
 from collections.abc import AsyncGenerator
+from unittest import mock
 import uuid
 
 from absl import flags
@@ -26,6 +30,7 @@ from absl.testing import absltest
 import db
 import dependencies
 from fastapi.testclient import TestClient
+import server
 from server import app
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -125,6 +130,14 @@ class IntegrationTest(absltest.TestCase):
     app.dependency_overrides[dependencies.get_transactions_db] = (
       override_get_transactions_db
     )
+    # Keep tests offline even when a Hedera .env is present.
+    app.dependency_overrides[dependencies.get_hedera_service] = lambda: None
+    # The startup warm-up calls the provider itself, so patch it there too.
+    patcher = mock.patch.object(
+      dependencies, "get_hedera_service", autospec=True, return_value=None
+    )
+    self.get_hedera_service = patcher.start()
+    self.addCleanup(patcher.stop)
 
     # Initialize Client
     self.client = TestClient(app)
@@ -424,8 +437,17 @@ class IntegrationTest(absltest.TestCase):
         ),
       )
       self.assertEqual(response.status_code, 200)
-      checkout = TestCheckout.model_validate(response.json())
+      canceled = response.json()
+      checkout = TestCheckout.model_validate(canceled)
       self.assertEqual(checkout.status, "canceled")
+      # The cancel body is the full checkout, extension fields included, the
+      # same as get_checkout returns.
+      self.assertIn("fulfillment", canceled)
+      response = self.client.get(
+        "/checkout-sessions/test_checkout_cancel", headers=self._get_headers()
+      )
+      self.assertEqual(response.status_code, 200)
+      self.assertEqual(canceled, response.json())
 
       # 3. Try to Cancel again (should fail)
       response = self.client.post(
@@ -471,6 +493,138 @@ class IntegrationTest(absltest.TestCase):
       self.assertEqual(response.status_code, 409)
       self.assertIn("Cannot cancel checkout", response.json()["detail"])
 
+  def test_startup_warms_up_hedera(self) -> None:
+    """Tests that startup warms up the Hedera service in the background."""
+    warmed_up = threading.Event()
+    hedera_service = mock.Mock()
+    hedera_service.warm_up = mock.AsyncMock(side_effect=warmed_up.set)
+    self.get_hedera_service.return_value = hedera_service
+
+    with self.client:
+      self.assertTrue(warmed_up.wait(timeout=5))
+    hedera_service.warm_up.assert_awaited_once_with()
+
+  def test_warm_up_failure_is_logged(self) -> None:
+    """Tests that a failing warm-up is logged instead of raised."""
+    self.get_hedera_service.side_effect = ValueError("no merchant key")
+
+    with self.assertLogs(server.logger, "WARNING") as logs:
+      asyncio.run(server._warm_up_hedera())
+    self.assertIn("no merchant key", logs.output[0])
+
+  def test_complete_checkout_invalid_body(self) -> None:
+    """Tests that malformed complete requests are rejected up front."""
+    with self.client:
+      # 1. Body that does not match CompleteCheckoutRequest
+      response = self.client.post(
+        "/checkout-sessions/test_checkout_invalid/complete",
+        headers=self._get_headers(),
+        json={"payment_data": "not-an-object", "risk_signals": {}},
+      )
+      self.assertEqual(response.status_code, 422)
+      self.assertEqual(response.json()["detail"][0]["loc"][0], "body")
+
+      # 2. Instrument id that is not a string
+      response = self.client.post(
+        "/checkout-sessions/test_checkout_invalid/complete",
+        headers=self._get_headers(),
+        json={"payment_data": {"id": 123}, "risk_signals": {}},
+      )
+      self.assertEqual(response.status_code, 400)
+      self.assertEqual(response.json()["code"], "INVALID_REQUEST")
+
+      # 3. Empty body, reported like any declared body FastAPI validates
+      response = self.client.post(
+        "/checkout-sessions/test_checkout_invalid/complete",
+        headers=self._get_headers(),
+      )
+      self.assertEqual(response.status_code, 422)
+      self.assertEqual(
+        [(error["type"], error["loc"]) for error in response.json()["detail"]],
+        [("missing", ["body"])],
+      )
+
+  def test_complete_checkout_without_content_type(self) -> None:
+    """Tests that a body without Content-Type is handled like FastAPI does."""
+    with self.client:
+      # Whether FastAPI parses a body without Content-Type depends on its
+      # version (strict_content_type), so compare against create_checkout.
+      response = self.client.post(
+        "/checkout-sessions",
+        headers=self._get_headers(),
+        content=json.dumps({}),
+      )
+      body_parsed = response.status_code != 422 or any(
+        error["type"] == "missing" for error in response.json()["detail"]
+      )
+
+      response = self.client.post(
+        "/checkout-sessions/test_checkout_invalid/complete",
+        headers=self._get_headers(),
+        content=json.dumps({"payment_data": {"id": 123}, "risk_signals": {}}),
+      )
+      if body_parsed:
+        # Parsed as JSON, so the request reaches the instrument id check.
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["code"], "INVALID_REQUEST")
+      else:
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"][0]["loc"][0], "body")
+
+  def test_order_event_webhook_invalid_payload(self) -> None:
+    """Tests that invalid webhook orders are rejected before persisting."""
+    # A complete order except for the required "id".
+    order = {
+      "ucp": {"version": "2026-01-11", "capabilities": []},
+      "checkout_id": "test_checkout_webhook",
+      "permalink_url": "https://example.com/orders/1",
+      "line_items": [],
+      "fulfillment": {},
+      "totals": [],
+    }
+    webhook_url = "/webhooks/partners/test_partner/events/order"
+    with self.client:
+      for content in ("{not json", "[]", json.dumps(order)):
+        with self.subTest(content=content):
+          response = self.client.post(
+            webhook_url,
+            headers={
+              **self._get_headers(),
+              "content-type": "application/json",
+            },
+            content=content,
+          )
+          self.assertEqual(response.status_code, 422)
+          for error in response.json()["detail"]:
+            self.assertEqual(error["loc"][0], "body")
+
+      self.assertIn(
+        ["body", "id"], [error["loc"] for error in response.json()["detail"]]
+      )
+
+  def test_openapi_request_bodies(self) -> None:
+    """Tests that implemented routes document their request bodies."""
+    schema = app.openapi()
+    components = schema["components"]["schemas"]
+    refs = re.findall(r'"#/components/schemas/([^"]+)"', json.dumps(schema))
+    self.assertEmpty(set(refs) - components.keys())
+
+    operations = {
+      operation["operationId"]: operation
+      for path in schema["paths"].values()
+      for operation in path.values()
+    }
+    for operation_id, model in (
+      ("complete_checkout", "CompleteCheckoutRequest"),
+      ("order_event_webhook", "Order"),
+    ):
+      with self.subTest(operation_id=operation_id):
+        request_body = operations[operation_id]["requestBody"]
+        self.assertEqual(
+          request_body["content"]["application/json"]["schema"],
+          {"$ref": f"#/components/schemas/{model}"},
+        )
+
 
 if __name__ == "__main__":
   absltest.main()
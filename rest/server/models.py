@@ -19,6 +19,10 @@ These models extend the base UCP SDK models by combining multiple extensions
 objects used by the sample server implementation.
 """
 
+from typing import Any
+
+from pydantic import BaseModel
+from ucp_sdk.models.schemas.shopping.ap2_mandate import Ap2CompleteRequest
 from ucp_sdk.models.schemas.shopping.ap2_mandate import (
   CheckoutResponseWithAp2 as Ap2Checkout,
 )
@@ -80,6 +84,14 @@ class UnifiedCheckoutUpdateRequest(
   """Update request model combining base fields and extensions."""
 
 
+class CompleteCheckoutRequest(BaseModel):
+  """Complete request body carrying opaque payment data and risk signals."""
+
+  payment_data: dict[str, Any]
+  risk_signals: dict[str, Any]
+  ap2: Ap2CompleteRequest | None = None
+
+
 UnifiedCheckout.model_rebuild()
 UnifiedCheckoutCreateRequest.model_rebuild()
 UnifiedCheckoutUpdateRequest.model_rebuild()
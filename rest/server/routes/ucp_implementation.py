@@ -17,19 +17,23 @@
 Injects business logic into generated routes.
 """
 
+from collections.abc import Callable
 import logging
 from typing import Annotated, Any
 
 import dependencies
+from exceptions import InvalidRequestError
 from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
 from fastapi import Path
+from fastapi import Response
 from fastapi.routing import APIRoute
 import models
 from models import UnifiedCheckoutCreateRequest
+from pydantic import BaseModel
+from pydantic import TypeAdapter
 from services.checkout_service import CheckoutService
-from ucp_sdk.models.schemas.shopping.ap2_mandate import Ap2CompleteRequest
 from ucp_sdk.models.schemas.shopping.order import Order
 from ucp_sdk.models.schemas.shopping.payment_create_req import (
   PaymentCreateRequest,
@@ -37,6 +41,34 @@ from ucp_sdk.models.schemas.shopping.payment_create_req import (
 
 logger = logging.getLogger(__name__)
 
+# Complete requests only vary in the selected instrument id, so they are
+# copied from a validated template instead of being re-validated each time.
+_PAYMENT_REQUEST_TEMPLATE = PaymentCreateRequest(
+  selected_instrument_id=None,
+  instruments=[],
+)
+
+# Stored orders are dumped through an adapter built once at import.
+_ORDER_ADAPTER = TypeAdapter(Order)
+
+
+def _json_response(model: BaseModel, status_code: int = 200) -> Response:
+  """Serialize a model into a JSON response.
+
+  pydantic-core writes the JSON bytes in a single pass, so FastAPI does not
+  need to walk an intermediate dict with jsonable_encoder.
+
+  Args:
+    model: The model to serialize (by alias).
+    status_code: The HTTP status code of the response.
+
+  """
+  return Response(
+    content=model.model_dump_json(by_alias=True),
+    status_code=status_code,
+    media_type="application/json",
+  )
+
 
 async def create_checkout(
   checkout_req: Annotated[UnifiedCheckoutCreateRequest, Body(...)],
@@ -47,14 +79,13 @@ async def create_checkout(
   checkout_service: Annotated[
     CheckoutService, Depends(dependencies.get_checkout_service)
   ],
-) -> dict[str, Any]:
+) -> Response:
   """Create Checkout Implementation."""
   del common_headers  # Unused
-  req_dict = checkout_req.model_dump(exclude_unset=True, by_alias=True)
-  unified_req = models.UnifiedCheckoutCreateRequest(**req_dict)
-
-  result = await checkout_service.create_checkout(unified_req, idempotency_key)
-  return result.model_dump(mode="json", by_alias=True)
+  # FastAPI has already validated the body into the unified model, so it can
+  # be handed to the service as-is.
+  result = await checkout_service.create_checkout(checkout_req, idempotency_key)
+  return _json_response(result, status_code=201)
 
 
 async def get_checkout(
@@ -65,11 +96,11 @@ async def get_checkout(
   checkout_service: Annotated[
     CheckoutService, Depends(dependencies.get_checkout_service)
   ],
-) -> dict[str, Any]:
+) -> Response:
   """Get Checkout Implementation."""
   del common_headers  # Unused
   result = await checkout_service.get_checkout(checkout_id)
-  return result.model_dump(mode="json", by_alias=True)
+  return _json_response(result)
 
 
 async def update_checkout(
@@ -82,22 +113,18 @@ async def update_checkout(
   checkout_service: Annotated[
     CheckoutService, Depends(dependencies.get_checkout_service)
   ],
-) -> dict[str, Any]:
+) -> Response:
   """Update Checkout Implementation."""
   del common_headers  # Unused
-  req_dict = checkout_req.model_dump(exclude_unset=True, by_alias=True)
-  unified_req = models.UnifiedCheckoutUpdateRequest(**req_dict)
-
   result = await checkout_service.update_checkout(
-    checkout_id, unified_req, idempotency_key
+    checkout_id, checkout_req, idempotency_key
   )
-  return result.model_dump(mode="json", by_alias=True)
+  return _json_response(result)
 
 
 async def complete_checkout(
   checkout_id: Annotated[str, Path(..., alias="id")],
-  payment_data: Annotated[dict[str, Any], Body(...)],
-  risk_signals: Annotated[dict[str, Any], Body(...)],
+  complete_req: Annotated[models.CompleteCheckoutRequest, Body(...)],
   common_headers: Annotated[
     dependencies.CommonHeaders, Depends(dependencies.common_headers)
   ],
@@ -105,22 +132,30 @@ async def complete_checkout(
   checkout_service: Annotated[
     CheckoutService, Depends(dependencies.get_checkout_service)
   ],
-  ap2: Annotated[Ap2CompleteRequest | None, Body()] = None,
-) -> dict[str, Any]:
+) -> Response:
   """Complete Checkout with Hedera Payment."""
   del common_headers  # Unused
+  payment_data = complete_req.payment_data
+  # model_copy does not validate the update, so check the client-supplied id
+  # against the selected_instrument_id type here.
+  instrument_id = payment_data.get("id")
+  if instrument_id is not None and not isinstance(instrument_id, str):
+    raise InvalidRequestError("payment_data.id must be a string")
 
   # Create payment request with raw Hedera payment data
-  payment_req = PaymentCreateRequest(
-    selected_instrument_id=payment_data.get("id"),
-    instruments=[],
+  payment_req = _PAYMENT_REQUEST_TEMPLATE.model_copy(
+    update={"selected_instrument_id": instrument_id, "instruments": []}
   )
   payment_req._raw_crypto_payment = payment_data
 
   checkout_result = await checkout_service.complete_checkout(
-    checkout_id, payment_req, risk_signals, idempotency_key, ap2=ap2
+    checkout_id,
+    payment_req,
+    complete_req.risk_signals,
+    idempotency_key,
+    ap2=complete_req.ap2,
   )
-  return checkout_result.model_dump(mode="json", by_alias=True)
+  return _json_response(checkout_result)
 
 
 async def cancel_checkout(
@@ -132,27 +167,30 @@ async def cancel_checkout(
   checkout_service: Annotated[
     CheckoutService, Depends(dependencies.get_checkout_service)
   ],
-) -> models.UnifiedCheckout:
+) -> Response:
   """Cancel Checkout Implementation."""
   del common_headers  # Unused
-  return await checkout_service.cancel_checkout(checkout_id, idempotency_key)
+  result = await checkout_service.cancel_checkout(checkout_id, idempotency_key)
+  return _json_response(result)
 
 
 async def order_event_webhook(
   partner_id: str,
-  payload: Annotated[Order, Body(...)],
+  order: Annotated[Order, Body(...)],
   # CommonHeaders checks ucp-agent, which might not be present in webhook?
   # Webhook server used specific headers.
-  # We verify signature using dependency.
-  signature: Annotated[None, Depends(dependencies.verify_signature)],
+  # We verify signature using dependency. Starlette caches the body, so it
+  # is read only once for the signature check and the Order.
+  body: Annotated[bytes, Depends(dependencies.verify_signature)],
   checkout_service: Annotated[
     CheckoutService, Depends(dependencies.get_checkout_service)
   ],
 ) -> dict[str, Any]:
   """Order Event Webhook Implementation."""
-  del partner_id, signature  # Unused
-  payload_dict = payload.model_dump(mode="json", by_alias=True)
-  await checkout_service.update_order(payload.id, payload_dict)
+  del partner_id, body  # Unused
+  await checkout_service.update_order(
+    order.id, _ORDER_ADAPTER.dump_python(order, mode="json", by_alias=True)
+  )
   return {"status": "ok"}
 
 
@@ -167,47 +205,72 @@ IMPLEMENTATIONS = {
 }
 
 
+def _clone_with_endpoint(
+  route: APIRoute, endpoint: Callable[..., Any]
+) -> APIRoute:
+  """Create a copy of a route that is served by a different endpoint.
+
+  Args:
+      route: The generated route whose metadata is kept.
+      endpoint: The implementation to serve the route.
+
+  Returns:
+      A new APIRoute for the same path and operation.
+
+  """
+  # We must use the new endpoint to generate correct dependencies. This
+  # signature analysis runs once, when the router is patched at import time;
+  # with Pydantic v2 FastAPI no longer clones response_model, so there is no
+  # per-route deep copy to cache.
+  responses = dict(route.responses)
+  if route.response_model is not None and route.status_code is not None:
+    # Implementations build their own JSON, so the response model is only
+    # kept for the OpenAPI schema. Passing it as response_model would make
+    # FastAPI validate and re-serialize every dict an endpoint returns.
+    responses[route.status_code] = {
+      **responses.get(route.status_code, {}),
+      "model": route.response_model,
+    }
+  return APIRoute(
+    path=route.path,
+    endpoint=endpoint,
+    methods=route.methods,
+    response_model=None,
+    responses=responses,
+    status_code=route.status_code,
+    tags=route.tags,
+    summary=route.summary,
+    description=route.description,
+    operation_id=route.operation_id,
+    # We do NOT copy route.dependencies because we want the dependencies
+    # from the NEW endpoint (impl). If the original route had
+    # dependencies (e.g. router level), they are usually added when
+    # including router. Here we are modifying the router's own routes.
+    # APIRoute(endpoint=impl) will parse impl's signature. If we passed
+    # `dependencies=route.dependencies`, it would be valid (list of
+    # dependencies). Generated ucp_routes.py doesn't seem to have
+    # route-level dependencies.
+    dependencies=route.dependencies,
+    response_class=route.response_class,
+    name=route.name,
+    callbacks=route.callbacks,
+    openapi_extra=route.openapi_extra,
+    generate_unique_id_function=route.generate_unique_id_function,
+  )
+
+
 def apply_implementation(router: APIRouter) -> None:
   """Replace router endpoints with implementations.
 
+  Matching routes are swapped in place, keeping their metadata from the
+  original route; all other routes are left untouched.
+
   Args:
       router: The APIRouter to modify.
 
   """
-  new_routes = []
-  for route in router.routes:
+  for index, route in enumerate(router.routes):
     if isinstance(route, APIRoute) and route.operation_id in IMPLEMENTATIONS:
-      impl = IMPLEMENTATIONS[route.operation_id]
-      # Create a new route with the implementation but keeping metadata from
-      # original route. We must use the new endpoint to generate correct
-      # dependencies.
-      new_route = APIRoute(
-        path=route.path,
-        endpoint=impl,
-        methods=route.methods,
-        response_model=route.response_model,
-        status_code=route.status_code,
-        tags=route.tags,
-        summary=route.summary,
-        description=route.description,
-        operation_id=route.operation_id,
-        # We do NOT copy route.dependencies because we want the dependencies
-        # from the NEW endpoint (impl). If the original route had
-        # dependencies (e.g. router level), they are usually added when
-        # including router. Here we are modifying the router's own routes.
-        # APIRoute(endpoint=impl) will parse impl's signature. If we passed
-        # `dependencies=route.dependencies`, it would be valid (list of
-        # dependencies). Generated ucp_routes.py doesn't seem to have
-        # route-level dependencies.
-        dependencies=route.dependencies,
-        response_class=route.response_class,
-        name=route.name,
-        callbacks=route.callbacks,
-        openapi_extra=route.openapi_extra,
-        generate_unique_id_function=route.generate_unique_id_function,
+      router.routes[index] = _clone_with_endpoint(
+        route, IMPLEMENTATIONS[route.operation_id]
       )
-      new_routes.append(new_route)
-    else:
-      new_routes.append(route)
-
-  router.routes = new_routes
@@ -17,11 +17,14 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
+import contextlib
 import logging
 import sys
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from absl import app as absl_app
 import config
+import dependencies
 from exceptions import UcpError
 from fastapi import FastAPI
 from fastapi import Request
@@ -37,11 +40,40 @@ import uvicorn
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+async def _warm_up_hedera() -> None:
+  """Build the shared Hedera service and connect it to the network."""
+  try:
+    # Key parsing and the mirror node lookup block, so run them off the loop.
+    hedera_service = await asyncio.to_thread(dependencies.get_hedera_service)
+    if hedera_service:
+      await hedera_service.warm_up()
+  except Exception as e:  # pylint: disable=broad-exception-caught
+    # Best effort only: a failure must neither stop the server nor surface
+    # when the task is awaited at shutdown.
+    logger.warning("Hedera warm-up failed: %s", e)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+  """Initialize databases and warm up the Hedera connection."""
+  async with config.lifespan(app):
+    # Warm up in the background so an unreachable network never delays
+    # startup; the first checkout simply connects itself in that case.
+    warm_up = asyncio.create_task(_warm_up_hedera())
+    try:
+      yield
+    finally:
+      warm_up.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await warm_up
+
+
 app = FastAPI(
   title="UCP Shopping Service",
   version=config.get_server_version(),
   description="Reference implementation of the UCP Shopping Service",
-  lifespan=config.lifespan,
+  lifespan=lifespan,
 )
 
 
@@ -119,19 +119,15 @@ class CheckoutService:
     products_session: AsyncSession,
     transactions_session: AsyncSession,
     base_url: str,
+    hedera_service: HederaPaymentService | None = None,
   ):
     """Initialize CheckoutService."""
     self.fulfillment_service = fulfillment_service
     self.products_session = products_session
     self.transactions_session = transactions_session
     self.base_url = base_url.rstrip("/")
-
-    # Initialize Hedera payment service if configured
-    try:
-      self.hedera_service = HederaPaymentService()
-    except (ValueError, Exception) as e:
-      logger.info("Hedera payment service not initialized: %s", e)
-      self.hedera_service = None
+    # Shared across requests; None when Hedera payments are not configured.
+    self.hedera_service = hedera_service
 
   def _compute_hash(self, data: Any) -> str:
     """Compute SHA256 hash of the JSON-serialized data."""
@@ -1207,7 +1203,7 @@ class CheckoutService:
     logger.info("Processing %.4f HBAR (%d tinybars)", expected_hbar, total_tinybars)
 
     try:
-      result = self.hedera_service.process_pre_signed_payment(
+      result = await self.hedera_service.process_pre_signed_payment(
         signed_transaction_base64=signed_tx,
         expected_amount_hbar=expected_hbar,
         checkout_id=checkout.id,
@@ -19,21 +19,96 @@ Clients sign transactions locally and submit them to the backend for validation
 and submission to the Hedera network.
 """
 
-import base64
+import asyncio
+import binascii
 import logging
 import os
 from typing import Any
 
 from hiero_sdk_python import AccountId
 from hiero_sdk_python import Client
+from hiero_sdk_python import CryptoGetAccountBalanceQuery
 from hiero_sdk_python import Hbar
 from hiero_sdk_python import Network
 from hiero_sdk_python import PrivateKey
+from hiero_sdk_python import ResponseCode
 from hiero_sdk_python import Transaction
 from hiero_sdk_python import TransferTransaction
 
 logger = logging.getLogger(__name__)
 
+# Receipt statuses are raw protobuf enum ints, so compare by value.
+_SUCCESS_STATUS = ResponseCode.SUCCESS
+
+# Hedera rejects transactions larger than 6 KiB, so anything whose base64
+# encoding exceeds that cannot be valid and is refused before decoding.
+_MAX_TRANSACTION_SIZE_BYTES = 6144
+_MAX_TRANSACTION_BASE64_LENGTH = 4 * -(-_MAX_TRANSACTION_SIZE_BYTES // 3)
+
+# Each submission holds a worker thread for the whole gRPC round-trip, so cap
+# how many run at once to keep a burst of checkouts from exhausting the pool.
+_MAX_CONCURRENT_SUBMISSIONS = 8
+
+# The warm-up probe is best effort: keep its retry budget short so a node
+# that is down cannot hold a worker thread (and delay shutdown) for the
+# client's full default budget of 10 attempts and a 120 s timeout.
+_WARM_UP_MAX_ATTEMPTS = 2
+_WARM_UP_REQUEST_TIMEOUT_SECONDS = 10
+_WARM_UP_GRPC_DEADLINE_SECONDS = 5
+
+_EXPLORER_BASE_URLS = {
+  "mainnet": "https://hashscan.io/mainnet",
+  "testnet": "https://hashscan.io/testnet",
+  "previewnet": "https://hashscan.io/previewnet",
+}
+
+
+_TARGET_NODE = (0, 0, 3)
+
+
+def _account_key(account_id: AccountId) -> tuple[Any, ...]:
+  """Return the fields AccountId.__eq__ compares, as a plain tuple.
+
+  Alias-form IDs all have num == 0, so the alias key and EVM address are
+  part of the key to keep distinct aliases from matching each other. Older
+  SDK releases have no evm_address attribute, nor compare on it.
+  """
+  return (
+    account_id.shard,
+    account_id.realm,
+    account_id.num,
+    account_id.alias_key,
+    getattr(account_id, "evm_address", None),
+  )
+
+
+def _build_network(
+  network_name: str, node_account: tuple[int, int, int]
+) -> Network:
+  """Build a Network restricted to a single consensus node.
+
+  Each call builds a fresh Network: a Client owns the node channels of its
+  Network and closes them in Client.close(), so it must not be shared.
+
+  Args:
+    network_name: Hedera network name (mainnet, testnet, previewnet)
+    node_account: (shard, realm, num) of the node to submit through
+
+  Returns:
+    A Network whose only node is the requested one
+
+  Raises:
+    ValueError: If the node is not part of the network
+  """
+  target_node = AccountId(*node_account)
+  network = Network(network=network_name)
+  nodes_by_id = {n._account_id: n for n in network.nodes}
+  if target_node not in nodes_by_id:
+    raise ValueError(f"Node {target_node} not found in network")
+  network.nodes = [nodes_by_id[target_node]]
+  network.current_node = network.nodes[0]
+  return network
+
 
 class HederaPaymentService:
   """Non-custodial Hedera payment processor.
@@ -57,19 +132,20 @@ class HederaPaymentService:
       )
 
     self.merchant_account_id = AccountId.from_string(merchant_account_str)
+    # Plain tuple for matching transfers without AccountId.__eq__.
+    self._merchant_key = _account_key(self.merchant_account_id)
+    self._explorer_base_url = _EXPLORER_BASE_URLS.get(
+      self.network_name, _EXPLORER_BASE_URLS["testnet"]
+    )
     merchant_private_key = PrivateKey.from_string_ecdsa(merchant_private_key_str)
 
     # Client needs operator to submit transactions to network
     # Use only node 0.0.3 to match what client uses when freezing transactions
-    target_node = AccountId(0, 0, 3)
-    network = Network(network=self.network_name)
-    network.nodes = [n for n in network.nodes if n._account_id == target_node]
-    if not network.nodes:
-      raise ValueError(f"Node {target_node} not found in network")
-    network.current_node = network.nodes[0]
+    network = _build_network(self.network_name, _TARGET_NODE)
 
     self.client = Client(network)
     self.client.set_operator(self.merchant_account_id, merchant_private_key)
+    self._submission_slots = asyncio.Semaphore(_MAX_CONCURRENT_SUBMISSIONS)
 
     logger.info(
       "Hedera service initialized: network=%s, merchant=%s",
@@ -77,7 +153,32 @@ class HederaPaymentService:
       self.merchant_account_id,
     )
 
-  def process_pre_signed_payment(
+  async def warm_up(self) -> None:
+    """Open the connection to the consensus node before the first payment.
+
+    Runs a free account balance query so the TLS certificate fetch and gRPC
+    channel setup happen ahead of time; the client then reuses the channel
+    for later submissions. Only newer SDK releases enable gRPC keepalive on
+    it, so with older ones an idle channel may still need to reconnect. The
+    query gives up quickly and failures are only logged, in which case the
+    first payment connects instead.
+    """
+    query = CryptoGetAccountBalanceQuery().set_account_id(
+      self.merchant_account_id
+    )
+    # Retry/timeout setters only exist in hiero-sdk-python >= 0.2.0.
+    if hasattr(query, "set_max_attempts"):
+      query.set_max_attempts(_WARM_UP_MAX_ATTEMPTS)
+      query.set_request_timeout(_WARM_UP_REQUEST_TIMEOUT_SECONDS)
+      query.set_grpc_deadline(_WARM_UP_GRPC_DEADLINE_SECONDS)
+    try:
+      await asyncio.to_thread(query.execute, self.client)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.warning("Hedera connection warm-up failed: %s", e)
+    else:
+      logger.info("Hedera connection to %s established", self.network_name)
+
+  async def process_pre_signed_payment(
     self,
     signed_transaction_base64: str,
     expected_amount_hbar: float,
@@ -100,9 +201,15 @@ class HederaPaymentService:
     logger.info("Processing Hedera payment for checkout %s", checkout_id)
 
     # 1. Decode transaction bytes
+    if not isinstance(signed_transaction_base64, str):
+      raise ValueError("Signed transaction must be a base64 string")
+    if len(signed_transaction_base64) > _MAX_TRANSACTION_BASE64_LENGTH:
+      raise ValueError(
+        "Signed transaction exceeds the maximum Hedera transaction size"
+      )
     try:
-      tx_bytes = base64.b64decode(signed_transaction_base64)
-    except Exception as e:
+      tx_bytes = binascii.a2b_base64(signed_transaction_base64)
+    except ValueError as e:  # binascii.Error or non-ASCII input
       raise ValueError(f"Invalid base64 encoding: {e}") from e
 
     # 2. Parse transaction
@@ -111,21 +218,26 @@ class HederaPaymentService:
     except Exception as e:
       raise ValueError(f"Invalid transaction bytes: {e}") from e
 
-    # Skip validation for now - just log expected amount
-    logger.info("Expected: %.4f HBAR", expected_amount_hbar)
+    # 3. Validate the transfer before anything is submitted
+    if not isinstance(transaction, TransferTransaction):
+      raise ValueError("Signed transaction is not a transfer transaction")
+    self._validate_transaction(transaction, expected_amount_hbar)
 
-    # 5. Submit to Hedera network
+    # 4. Submit to Hedera network
+    # execute() blocks on the gRPC round-trip and receipt polling, so run it in
+    # a worker thread to keep the event loop serving other requests.
     logger.info("Submitting transaction to %s", self.network_name)
     try:
-      receipt = transaction.execute(self.client)
+      async with self._submission_slots:
+        receipt = await asyncio.to_thread(transaction.execute, self.client)
     except Exception as e:
       logger.error("Transaction submission failed: %s", e)
       raise Exception(f"Hedera network error: {e}") from e
 
-    # 6. Check receipt status
-    from hiero_sdk_python import ResponseCode
-    if receipt.status != ResponseCode.SUCCESS:
-      raise Exception(f"Transaction failed with status: {receipt.status.name}")
+    # 5. Check receipt status
+    if receipt.status != _SUCCESS_STATUS:
+      status_name = ResponseCode(receipt.status).name
+      raise Exception(f"Transaction failed with status: {status_name}")
 
     transaction_id = str(receipt.transaction_id)
     logger.info(
@@ -157,55 +269,48 @@ class HederaPaymentService:
     """
     # Get transfer details (list of transfers)
     transfers = transaction.hbar_transfers
-    logger.debug("Transaction transfers: %s (type: %s)", transfers, type(transfers))
-
-    # Find transfer to merchant account
-    # hbar_transfers is a list - each item has account_id and amount attributes
-    merchant_transfer = None
-    for transfer in transfers:
-      # Handle both object and tuple formats
-      if hasattr(transfer, "account_id"):
-        acct = transfer.account_id
-        amt = transfer.amount
-      elif isinstance(transfer, tuple) and len(transfer) >= 2:
-        acct, amt = transfer[0], transfer[1]
-      else:
-        logger.warning("Unknown transfer format: %s", transfer)
-        continue
-
-      if acct == self.merchant_account_id:
-        merchant_transfer = amt
-        break
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug(
+        "Transaction transfers: %s (type: %s)", transfers, type(transfers)
+      )
+
+    # Find transfer to merchant account. Every supported SDK release parses
+    # hbar_transfers into HbarTransfer objects.
+    merchant_key = self._merchant_key
+    merchant_transfer = next(
+      (
+        transfer.amount
+        for transfer in transfers
+        if _account_key(transfer.account_id) == merchant_key
+      ),
+      None,
+    )
 
     if merchant_transfer is None:
       raise ValueError(
         f"No transfer to merchant account {self.merchant_account_id} found"
       )
 
-    # Validate amount (convert to HBAR for comparison)
-    if hasattr(merchant_transfer, "to_hbar"):
-      actual_hbar = merchant_transfer.to_hbar()
+    # Validate amount in integer tinybars (1 HBAR = 100,000,000 tinybars)
+    if isinstance(merchant_transfer, Hbar):
+      actual_tinybars = merchant_transfer.to_tinybars()
     else:
-      actual_hbar = Hbar(float(merchant_transfer) / 100_000_000)
-    expected_hbar = Hbar(expected_amount_hbar)
+      actual_tinybars = int(merchant_transfer)
+    expected_tinybars = round(expected_amount_hbar * 100_000_000)
 
-    if actual_hbar < expected_hbar:
+    if actual_tinybars < expected_tinybars:
       raise ValueError(
-        f"Insufficient amount: expected {expected_hbar}, got {actual_hbar}"
+        f"Insufficient amount: expected"
+        f" {Hbar.from_tinybars(expected_tinybars)},"
+        f" got {Hbar.from_tinybars(actual_tinybars)}"
       )
 
     logger.info(
-      "Transaction validated: %s HBAR to %s",
-      actual_hbar,
+      "Transaction validated: %d tinybars to %s",
+      actual_tinybars,
       self.merchant_account_id,
     )
 
   def _get_explorer_url(self, transaction_id: str) -> str:
     """Generate HashScan explorer URL for transaction."""
-    base_urls = {
-      "mainnet": "https://hashscan.io/mainnet",
-      "testnet": "https://hashscan.io/testnet",
-      "previewnet": "https://hashscan.io/previewnet",
-    }
-    base_url = base_urls.get(self.network_name, "https://hashscan.io/testnet")
-    return f"{base_url}/transaction/{transaction_id}"
+    return f"{self._explorer_base_url}/transaction/{transaction_id}"